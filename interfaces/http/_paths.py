@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+# Resolved exactly once at first import; db.py and main.py previously each ran
+# their own Path(...).resolve() chains at module load.
+BASE_DIR = Path(__file__).resolve().parents[2]
+DATA_DIR = BASE_DIR / "data"
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
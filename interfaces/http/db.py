@@ -1,21 +1,60 @@
 from __future__ import annotations
 
+import atexit
 import sqlite3
+import threading
 from contextlib import contextmanager
 import os
 from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parents[2]
-DATA_DIR = BASE_DIR / "data"
+from interfaces.http._paths import DATA_DIR
 
+__all__ = ("init_db", "get_conn", "get_readonly_conn", "resolve_db_path")
 
-def resolve_db_path() -> Path:
+
+def resolve_db_path() -> Path | str:
     configured = os.getenv("ATRIUM_DB_PATH")
     if configured:
+        # SQLite URIs (file:...?mode=memory&cache=shared and friends) must be
+        # passed through verbatim; Path.resolve() would mangle the query part.
+        if configured.startswith("file:"):
+            return configured
         return Path(configured).expanduser().resolve()
     return DATA_DIR / "decision_graph.db"
 
 
+# Resolved once instead of per connection: resolve_db_path() costs several
+# stat() syscalls. init_db() refreshes it so tests that repoint
+# ATRIUM_DB_PATH before app startup still take effect.
+_DB_PATH: Path | str = resolve_db_path()
+
+
+def _reset_db_path() -> Path | str:
+    global _DB_PATH
+    _DB_PATH = resolve_db_path()
+    return _DB_PATH
+
+
+# Applied to every connection. journal_mode=WAL is persistent and set once in
+# init_db(); the rest are per-connection settings that keep readers off the
+# writer's back and avoid an fsync per commit.
+CONNECTION_PRAGMAS_SQL = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-64000;
+PRAGMA busy_timeout=5000;
+PRAGMA wal_autocheckpoint=10000;
+PRAGMA journal_size_limit=67108864;
+PRAGMA foreign_keys=ON;
+"""
+
+# Extra settings for throwaway databases (gated on ATRIUM_TEST_MODE): losing
+# a commit to a crash is acceptable in a test run, so skip the WAL fsync too.
+TEST_MODE_PRAGMAS_SQL = """
+PRAGMA synchronous=OFF;
+"""
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS sessions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -74,57 +113,246 @@ CREATE TABLE IF NOT EXISTS event_log (
 """
 
 
+# Keep sessions.graph_version in sync with every graph mutation so the HTTP
+# layer can fingerprint a session's graph with a single-row probe.
+GRAPH_VERSION_TRIGGERS_SQL = """
+CREATE TRIGGER IF NOT EXISTS trg_graph_version_node_insert
+AFTER INSERT ON nodes BEGIN
+    UPDATE sessions SET graph_version = graph_version + 1 WHERE id = NEW.session_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_graph_version_node_update
+AFTER UPDATE ON nodes BEGIN
+    UPDATE sessions SET graph_version = graph_version + 1 WHERE id = NEW.session_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_graph_version_choice_insert
+AFTER INSERT ON choices BEGIN
+    UPDATE sessions SET graph_version = graph_version + 1
+    WHERE id = (SELECT session_id FROM nodes WHERE id = NEW.node_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_graph_version_choice_update
+AFTER UPDATE ON choices BEGIN
+    UPDATE sessions SET graph_version = graph_version + 1
+    WHERE id = (SELECT session_id FROM nodes WHERE id = NEW.node_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_graph_version_edge_insert
+AFTER INSERT ON edges BEGIN
+    UPDATE sessions SET graph_version = graph_version + 1
+    WHERE id = (SELECT session_id FROM nodes WHERE id = NEW.from_node_id);
+END;
+"""
+
+
+# An in-memory shared-cache database lives only while at least one connection
+# holds it open; init_db() parks its own connection here so the schema it just
+# created survives until the next init_db() (or process exit) for URI paths.
+_anchor_conn: sqlite3.Connection | None = None
+
+
 def init_db() -> None:
-    db_path = resolve_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(db_path) as conn:
-        conn.executescript(SCHEMA_SQL)
-        _run_migrations(conn)
-        conn.execute(
-            """
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_external_id
-            ON sessions(external_id)
-            WHERE external_id IS NOT NULL
-            """
-        )
-        conn.execute(
-            """
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_nodes_external_ref
-            ON nodes(external_ref)
-            WHERE external_ref IS NOT NULL
-            """
-        )
-        conn.execute(
-            """
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_choices_node_label
-            ON choices(node_id, label)
-            """
+    global _anchor_conn
+    db_path = _reset_db_path()
+    is_uri = isinstance(db_path, str)
+    if not is_uri:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, uri=is_uri)
+    with conn:
+        # A database already at SCHEMA_VERSION has its full DDL (schema,
+        # migrations, indexes, triggers); one PRAGMA read replaces the whole
+        # CREATE ... IF NOT EXISTS cascade on every startup after the first.
+        provisioned = (
+            conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
         )
-        conn.commit()
+        if not provisioned:
+            _provision(conn)
+    if is_uri:
+        previous = _anchor_conn
+        _anchor_conn = conn
+        if previous is not None:
+            previous.close()
+    else:
+        conn.close()
+
+
+def _provision(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(CONNECTION_PRAGMAS_SQL)
+    conn.executescript(SCHEMA_SQL)
+    _run_migrations(conn)
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_external_id
+        ON sessions(external_id)
+        WHERE external_id IS NOT NULL
+        """
+    )
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_nodes_external_ref
+        ON nodes(external_ref)
+        WHERE external_ref IS NOT NULL
+        """
+    )
+    conn.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_choices_node_label
+        ON choices(node_id, label)
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_sessions_created
+        ON sessions(created_at DESC, id DESC)
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_nodes_session_id ON nodes(session_id, id)"
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_nodes_session_type_id
+        ON nodes(session_id, type, id DESC)
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_nodes_session_external_ref
+        ON nodes(session_id, external_ref)
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_choices_node_id ON choices(node_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_node_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_node_id)"
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_event_log_session
+        ON event_log(session_id, received_at)
+        """
+    )
+    conn.executescript(GRAPH_VERSION_TRIGGERS_SQL)
+    conn.commit()
+
+
+# Each FastAPI threadpool worker keeps one long-lived connection per database
+# path instead of paying connect + PRAGMA setup per request. Keyed by path so
+# tests that repoint ATRIUM_DB_PATH get a fresh connection.
+_local = threading.local()
+_open_connections: list[sqlite3.Connection] = []
+_open_connections_lock = threading.Lock()
+
+
+def _configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Connect-time hook: every pooled connection gets the same PRAGMA profile
+    and row factory, mirroring an engine 'connect' listener."""
+    conn.executescript(CONNECTION_PRAGMAS_SQL)
+    if os.getenv("ATRIUM_TEST_MODE"):
+        conn.executescript(TEST_MODE_PRAGMAS_SQL)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _thread_conn(db_path: Path | str, readonly: bool = False) -> sqlite3.Connection:
+    cache: dict[str, sqlite3.Connection] = getattr(_local, "connections", None) or {}
+    if not hasattr(_local, "connections"):
+        _local.connections = cache
+    key = f"ro:{db_path}" if readonly else str(db_path)
+    conn = cache.get(key)
+    if conn is None:
+        if isinstance(db_path, str):
+            # Already a URI (in-memory test databases); mode=ro cannot be
+            # grafted onto it, so readers share the read-write form.
+            conn = sqlite3.connect(
+                db_path, uri=True, check_same_thread=False, cached_statements=128
+            )
+        elif readonly:
+            conn = sqlite3.connect(
+                f"file:{db_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=128,
+            )
+        else:
+            conn = sqlite3.connect(
+                db_path, check_same_thread=False, cached_statements=128
+            )
+        _configure_connection(conn)
+        cache[key] = conn
+        with _open_connections_lock:
+            _open_connections.append(conn)
+    return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    with _open_connections_lock:
+        for conn in _open_connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _open_connections.clear()
 
 
 @contextmanager
 def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(resolve_db_path())
-    conn.row_factory = sqlite3.Row
+    conn = _thread_conn(_DB_PATH)
     try:
         yield conn
         conn.commit()
-    finally:
-        conn.close()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+@contextmanager
+def get_readonly_conn() -> sqlite3.Connection:
+    """Connection for SELECT-only handlers.
+
+    Opened with mode=ro so readers never take the write lock (get_conn's
+    unconditional commit briefly does, even for pure SELECT paths).
+    """
+    yield _thread_conn(_DB_PATH, readonly=True)
+
+
+# Bump when adding a migration step below. PRAGMA user_version marks how far
+# a database file has been migrated, so already-migrated files pay a single
+# PRAGMA read at startup instead of re-inspecting every table.
+SCHEMA_VERSION = 2
 
 
 def _run_migrations(conn: sqlite3.Connection) -> None:
-    _ensure_column(conn, "sessions", "external_id", "TEXT")
-    _ensure_column(conn, "nodes", "external_ref", "TEXT")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+    if version < 1:
+        _ensure_column(conn, "sessions", "external_id", "TEXT")
+        _ensure_column(conn, "nodes", "external_ref", "TEXT")
+    if version < 2:
+        _ensure_column(
+            conn, "sessions", "graph_version", "INTEGER NOT NULL DEFAULT 0"
+        )
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
 
 def _ensure_column(
     conn: sqlite3.Connection, table_name: str, column_name: str, column_type: str
 ) -> None:
-    existing = conn.execute(f"PRAGMA table_info({table_name})").fetchall()
-    names = {row[1] for row in existing}
-    if column_name not in names:
+    # pragma_table_info as a table-valued function lets SQLite filter to the
+    # one column we care about instead of materializing every column row.
+    row = conn.execute(
+        "SELECT 1 FROM pragma_table_info(?) WHERE name = ?",
+        (table_name, column_name),
+    ).fetchone()
+    if row is None:
         conn.execute(
             f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
         )
@@ -1,29 +1,136 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime
-import json
-from pathlib import Path
+import hashlib
 import sqlite3
-from typing import Any, Literal
+import threading
+from typing import Any, Callable, Literal
 
-from fastapi import FastAPI, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse
+import jinja2
+import orjson
+
+from fastapi import Depends, FastAPI, Form, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
-from interfaces.http.db import get_conn, init_db
+from interfaces.http._paths import DATA_DIR, TEMPLATES_DIR
+from interfaces.http.db import get_conn, get_readonly_conn, init_db
 
 
-@asynccontextmanager
-async def lifespan(_: FastAPI):
+def _init_and_warm_db() -> None:
     init_db()
-    yield
+    # The database path may have been repointed (tests do this), so any
+    # memoized session list belongs to the previous database.
+    _invalidate_sessions_cache()
+    # Prime a pooled connection so the first request reuses a warm page cache
+    # instead of paying connect + PRAGMA setup.
+    with get_conn() as conn:
+        conn.execute("SELECT 1").fetchone()
+
+
+def _warm_templates() -> None:
+    # Compile the per-request templates once at startup instead of on the
+    # first panel click; repeated renders then hit Jinja's template cache.
+    for name in (
+        "session_workspace.html",
+        "partials/node_detail_panel.html",
+        "partials/replay_prompt.html",
+    ):
+        templates.env.get_template(name)
+
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    # Schema creation runs in a worker thread so uvicorn can start accepting
+    # traffic immediately; _db_ready blocks the first requests until done.
+    app_.state.init_task = asyncio.create_task(asyncio.to_thread(_init_and_warm_db))
+    _warm_templates()
+    try:
+        yield
+    finally:
+        await app_.state.init_task
+
+
+async def _db_ready(request: Request) -> None:
+    await request.app.state.init_task
 
 
-app = FastAPI(title="Atrium", lifespan=lifespan)
-TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+app = FastAPI(
+    title="Atrium",
+    lifespan=lifespan,
+    dependencies=[Depends(_db_ready)],
+    default_response_class=ORJSONResponse,
+)
+# auto_reload off: templates don't change at runtime, so skip the per-render
+# mtime stat. The session page and list partial are compiled once at import;
+# the bytecode cache keeps compiled templates across process restarts.
+_JINJA_CACHE_DIR = DATA_DIR / "jinja_cache"
+_JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+templates.env.auto_reload = False
+templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache(str(_JINJA_CACHE_DIR))
+_SESSIONS_TPL = templates.env.get_template("sessions.html")
+_SESSION_LIST_TPL = templates.env.get_template("partials/session_list.html")
+
+# Hot-path SQL lives in module-level constants so the per-connection statement
+# cache (see cached_statements in db.py) always sees the same statement text.
+_SESSION_FIELDS = "id, external_id, name, started_at, ended_at, created_at"
+_NODE_FIELDS = (
+    "id, session_id, external_ref, type, title, status, "
+    "rationale, owner, priority, context_prompt, created_at, updated_at"
+)
+
+# created_at is stored as ISO-8601 text, so plain lexicographic ordering is
+# chronological and lets the idx_sessions_created index drive the sort.
+SQL_LIST_SESSIONS = (
+    f"SELECT {_SESSION_FIELDS} FROM sessions ORDER BY created_at DESC, id DESC"
+)
+SQL_GET_SESSION = f"SELECT {_SESSION_FIELDS} FROM sessions WHERE id = ?"
+# started_at comes from SQLite itself — no Python-side datetime formatting,
+# and it matches the format created_at already uses.
+SQL_INSERT_SESSION = (
+    "INSERT INTO sessions (external_id, name, started_at)"
+    " VALUES (?, ?, datetime('now')) "
+    f"RETURNING {_SESSION_FIELDS}"
+)
+SQL_GET_NODE = f"SELECT {_NODE_FIELDS} FROM nodes WHERE id = ?"
+SQL_GET_SESSION_NODE = (
+    f"SELECT {_NODE_FIELDS} FROM nodes WHERE id = ? AND session_id = ?"
+)
+_NODE_FIELDS_PREFIXED = ", ".join(f"n.{field.strip()}" for field in _NODE_FIELDS.split(","))
+SQL_GET_NODE_PANEL = (
+    f"SELECT {_NODE_FIELDS_PREFIXED},"
+    " c.id, c.label, c.text, c.is_chosen, c.chosen_at"
+    " FROM nodes n LEFT JOIN choices c ON c.node_id = n.id"
+    " WHERE n.id = ? AND n.session_id = ?"
+    " ORDER BY c.id ASC"
+)
+SQL_INSERT_NODE = (
+    "INSERT INTO nodes ("
+    " session_id, type, title, status, rationale, owner, priority,"
+    " context_prompt, external_ref"
+    ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    f"RETURNING {_NODE_FIELDS}"
+)
+# executemany cannot use RETURNING, so the bulk path inserts without it and
+# reads the created rows back in one ranged SELECT.
+SQL_INSERT_NODE_BULK = SQL_INSERT_NODE.split(" RETURNING")[0]
+# One invariant statement regardless of which PATCH fields were supplied, so
+# the statement cache always hits. COALESCE means a bound NULL leaves the
+# column unchanged — which matches NodeUpdate, where omitted fields arrive as
+# None and none of the columns are clearable through this endpoint.
+SQL_UPDATE_NODE = (
+    "UPDATE nodes SET"
+    " status = COALESCE(?, status),"
+    " rationale = COALESCE(?, rationale),"
+    " owner = COALESCE(?, owner),"
+    " priority = COALESCE(?, priority),"
+    " updated_at = datetime('now')"
+    f" WHERE id = ? RETURNING {_NODE_FIELDS}"
+)
 
 NodeType = Literal["question", "decision", "task"]
 NodeStatus = Literal["open", "in_progress", "blocked", "done"]
@@ -128,34 +235,35 @@ class ReplayPromptOut(BaseModel):
     prompt: str
 
 
-def _rows_to_sessions(rows: list) -> list[SessionOut]:
-    return [
-        SessionOut(
-            id=row["id"],
-            external_id=row["external_id"],
-            name=row["name"],
-            started_at=row["started_at"],
-            ended_at=row["ended_at"],
-            created_at=row["created_at"],
-        )
-        for row in rows
-    ]
+# Row conversion uses positional indexing (matching _SESSION_FIELDS and
+# _NODE_FIELDS order) plus model_construct: values coming out of our own typed
+# schema do not need another round of Pydantic validation, and positional
+# access skips sqlite3.Row's per-field name resolution.
+def _row_to_session(row) -> SessionOut:
+    return SessionOut.model_construct(
+        id=row[0],
+        external_id=row[1],
+        name=row[2],
+        started_at=row[3],
+        ended_at=row[4],
+        created_at=row[5],
+    )
 
 
 def _row_to_node(row) -> NodeOut:
-    return NodeOut(
-        id=row["id"],
-        session_id=row["session_id"],
-        external_ref=row["external_ref"],
-        type=row["type"],
-        title=row["title"],
-        status=row["status"],
-        rationale=row["rationale"],
-        owner=row["owner"],
-        priority=row["priority"],
-        context_prompt=row["context_prompt"],
-        created_at=row["created_at"],
-        updated_at=row["updated_at"],
+    return NodeOut.model_construct(
+        id=row[0],
+        session_id=row[1],
+        external_ref=row[2],
+        type=row[3],
+        title=row[4],
+        status=row[5],
+        rationale=row[6],
+        owner=row[7],
+        priority=row[8],
+        context_prompt=row[9],
+        created_at=row[10],
+        updated_at=row[11],
     )
 
 
@@ -166,12 +274,8 @@ def home(request: Request) -> HTMLResponse:
 
 @app.get("/sessions", response_class=HTMLResponse)
 def sessions_page(request: Request) -> HTMLResponse:
-    sessions = list_sessions()
-    return templates.TemplateResponse(
-        request,
-        "sessions.html",
-        {"sessions": sessions},
-    )
+    sessions = _fetch_sessions()
+    return HTMLResponse(_SESSIONS_TPL.render(sessions=sessions))
 
 
 @app.get("/sessions/{session_id}", response_class=HTMLResponse)
@@ -180,68 +284,63 @@ def session_workspace_page(
     session_id: int,
     status: NodeStatus | None = None,
     unchosen_only: bool = False,
-) -> HTMLResponse:
+) -> StreamingResponse:
     graph = _build_session_graph(
         session_id=session_id,
         status=status,
         unchosen_only=unchosen_only,
     )
-    return templates.TemplateResponse(
-        request,
-        "session_workspace.html",
-        {
-            "session": graph.session,
-            "graph": graph,
-            "active_status": status,
-            "unchosen_only": unchosen_only,
-        },
+    # Stream the render: the browser gets <head> while the rest of a large
+    # graph page is still being generated, instead of buffering the full
+    # document in memory first.
+    template = templates.env.get_template("session_workspace.html")
+    return StreamingResponse(
+        template.generate(
+            session=graph.session,
+            graph=graph,
+            active_status=status,
+            unchosen_only=unchosen_only,
+        ),
+        media_type="text/html",
     )
 
 
 @app.get("/sessions/{session_id}/nodes/{node_id}/panel", response_class=HTMLResponse)
-def node_detail_panel(request: Request, session_id: int, node_id: int) -> HTMLResponse:
-    with get_conn() as conn:
-        row = conn.execute(
-            """
-            SELECT
-                id, session_id, external_ref, type, title, status,
-                rationale, owner, priority, context_prompt,
-                created_at, updated_at
-            FROM nodes
-            WHERE id = ? AND session_id = ?
-            """,
-            (node_id, session_id),
-        ).fetchone()
-        if row is None:
-            raise HTTPException(status_code=404, detail="Node not found")
+async def node_detail_panel(
+    request: Request, session_id: int, node_id: int
+) -> HTMLResponse:
+    return await asyncio.to_thread(_node_detail_panel_sync, request, session_id, node_id)
 
-        choices = conn.execute(
-            """
-            SELECT id, node_id, label, text, is_chosen, chosen_at
-            FROM choices
-            WHERE node_id = ?
-            ORDER BY id ASC
-            """,
-            (node_id,),
-        ).fetchall()
 
+def _node_detail_panel_sync(
+    request: Request, session_id: int, node_id: int
+) -> HTMLResponse:
+    # One LEFT JOIN round trip for the node and its choices; choice columns
+    # are NULL for choice-less nodes.
+    with get_readonly_conn() as conn:
+        rows = conn.execute(SQL_GET_NODE_PANEL, (node_id, session_id)).fetchall()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Node not found")
+
+    choices = [
+        ChoiceOut.model_construct(
+            id=row[12],
+            node_id=node_id,
+            label=row[13],
+            text=row[14],
+            is_chosen=bool(row[15]),
+            chosen_at=row[16],
+        )
+        for row in rows
+        if row[12] is not None
+    ]
     return templates.TemplateResponse(
         request,
         "partials/node_detail_panel.html",
         {
-            "node": _row_to_node(row),
+            "node": _row_to_node(rows[0]),
             "session_id": session_id,
-            "choices": [
-                ChoiceOut(
-                    id=choice["id"],
-                    node_id=choice["node_id"],
-                    label=choice["label"],
-                    text=choice["text"],
-                    is_chosen=bool(choice["is_chosen"]),
-                    chosen_at=choice["chosen_at"],
-                )
-                for choice in choices
-            ],
+            "choices": choices,
         },
     )
 
@@ -281,154 +380,182 @@ def create_session_form(request: Request, name: str = Form(...)) -> HTMLResponse
     if not cleaned:
         raise HTTPException(status_code=400, detail="Session name is required")
 
-    create_session(SessionCreate(name=cleaned))
-    sessions = list_sessions()
-    return templates.TemplateResponse(
-        request,
-        "partials/session_list.html",
-        {"sessions": sessions},
-    )
+    # The form value is already length-checked above; model_construct skips a
+    # second round of Pydantic validation.
+    create_session(SessionCreate.model_construct(name=cleaned, external_id=None))
+    sessions = _fetch_sessions()
+    return HTMLResponse(_SESSION_LIST_TPL.render(sessions=sessions))
+
+
+# Session-list memo for the HTML pages: sessions change rarely relative to
+# renders, so repeat reads skip SQLite entirely. Writers bump the version;
+# a cached list is served only while its version still matches.
+_sessions_cache_lock = threading.Lock()
+_sessions_cache_version = 0
+_sessions_cache: tuple[int, list[SessionOut]] | None = None
+
+
+def _invalidate_sessions_cache() -> None:
+    global _sessions_cache_version
+    with _sessions_cache_lock:
+        _sessions_cache_version += 1
+
+
+def _fetch_sessions() -> list[SessionOut]:
+    global _sessions_cache
+    with _sessions_cache_lock:
+        version = _sessions_cache_version
+        cached = _sessions_cache
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with get_readonly_conn() as conn:
+        rows = conn.execute(SQL_LIST_SESSIONS).fetchall()
+    sessions = [_row_to_session(row) for row in rows]
+    with _sessions_cache_lock:
+        # Only publish if no write landed while we were querying.
+        if _sessions_cache_version == version:
+            _sessions_cache = (version, sessions)
+    return sessions
 
 
 @app.get("/api/sessions", response_model=list[SessionOut])
-def list_sessions() -> list[SessionOut]:
-    with get_conn() as conn:
-        rows = conn.execute(
-            """
-            SELECT id, external_id, name, started_at, ended_at, created_at
-            FROM sessions
-            ORDER BY datetime(created_at) DESC, id DESC
-            """
-        ).fetchall()
-    return _rows_to_sessions(rows)
+async def list_sessions() -> ORJSONResponse:
+    return await asyncio.to_thread(_list_sessions_sync)
+
+
+def _list_sessions_sync() -> ORJSONResponse:
+    # Serialize straight from the rows: returning a Response bypasses the
+    # Pydantic round-trip while response_model keeps the OpenAPI schema.
+    with get_readonly_conn() as conn:
+        rows = conn.execute(SQL_LIST_SESSIONS).fetchall()
+    return ORJSONResponse(
+        [
+            {
+                "id": row[0],
+                "external_id": row[1],
+                "name": row[2],
+                "started_at": row[3],
+                "ended_at": row[4],
+                "created_at": row[5],
+            }
+            for row in rows
+        ]
+    )
 
 
 @app.post("/api/sessions", response_model=SessionOut, status_code=201)
 def create_session(payload: SessionCreate) -> SessionOut:
-    now = datetime.now(UTC).isoformat(timespec="seconds")
     try:
         with get_conn() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO sessions (external_id, name, started_at)
-                VALUES (?, ?, ?)
-                """,
-                (payload.external_id, payload.name.strip(), now),
-            )
-            session_id = cursor.lastrowid
             row = conn.execute(
-                """
-                SELECT id, external_id, name, started_at, ended_at, created_at
-                FROM sessions
-                WHERE id = ?
-                """,
-                (session_id,),
+                SQL_INSERT_SESSION,
+                (payload.external_id, payload.name.strip()),
             ).fetchone()
     except sqlite3.IntegrityError as exc:
         raise HTTPException(status_code=409, detail="Session external_id already exists") from exc
-    return _rows_to_sessions([row])[0]
+    _invalidate_sessions_cache()
+    return _row_to_session(row)
 
 
 @app.get("/api/sessions/{session_id}", response_model=SessionOut)
-def get_session(session_id: int) -> SessionOut:
-    with get_conn() as conn:
+async def get_session(session_id: int) -> SessionOut:
+    return await asyncio.to_thread(_get_session_sync, session_id)
+
+
+def _get_session_sync(session_id: int) -> SessionOut:
+    with get_readonly_conn() as conn:
+        row = conn.execute(SQL_GET_SESSION, (session_id,)).fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return _row_to_session(row)
+
+
+_GRAPH_CACHE_CONTROL = "private, must-revalidate"
+
+
+def _session_graph_etag(
+    session_id: int, status: NodeStatus | None, unchosen_only: bool
+) -> str:
+    # graph_version is bumped by triggers on every node/choice/edge write
+    # (see db.py), so the ETag is a single-row probe.
+    with get_readonly_conn() as conn:
         row = conn.execute(
-            """
-            SELECT id, external_id, name, started_at, ended_at, created_at
-            FROM sessions
-            WHERE id = ?
-            """,
-            (session_id,),
+            "SELECT graph_version FROM sessions WHERE id = ?", (session_id,)
         ).fetchone()
     if row is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    return _rows_to_sessions([row])[0]
+    key = f"{session_id}:{status}:{unchosen_only}:{row[0]}"
+    return f'"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
 
 
 @app.get("/api/sessions/{session_id}/graph", response_model=SessionGraphOut)
-def get_session_graph(
+async def get_session_graph(
+    request: Request,
+    response: Response,
     session_id: int,
     status: NodeStatus | None = None,
     unchosen_only: bool = False,
-) -> SessionGraphOut:
-    return _build_session_graph(
-        session_id=session_id,
-        status=status,
-        unchosen_only=unchosen_only,
+) -> Response | SessionGraphOut:
+    etag = await asyncio.to_thread(_session_graph_etag, session_id, status, unchosen_only)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": _GRAPH_CACHE_CONTROL},
+        )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _GRAPH_CACHE_CONTROL
+    return await asyncio.to_thread(
+        _build_session_graph, session_id, status, unchosen_only
     )
 
 
+# Whole graph in one statement: the session row plus three scalar subqueries
+# that aggregate nodes, edges, and choices to JSON inside SQLite. One cursor
+# round trip instead of four, and the array assembly stays in C.
+SQL_SESSION_GRAPH = f"""
+SELECT {_SESSION_FIELDS},
+    (SELECT json_group_array(json_object(
+        'id', n.id, 'session_id', n.session_id, 'external_ref', n.external_ref,
+        'type', n.type, 'title', n.title, 'status', n.status,
+        'rationale', n.rationale, 'owner', n.owner, 'priority', n.priority,
+        'context_prompt', n.context_prompt,
+        'created_at', n.created_at, 'updated_at', n.updated_at))
+     FROM (SELECT * FROM nodes WHERE session_id = sessions.id ORDER BY id) n),
+    (SELECT json_group_array(json_object(
+        'id', e.id, 'from_node_id', e.from_node_id, 'to_node_id', e.to_node_id,
+        'type', e.type, 'created_at', e.created_at))
+     FROM (SELECT e.* FROM edges e
+           JOIN nodes n ON n.id = e.from_node_id
+           WHERE n.session_id = sessions.id
+           ORDER BY e.id) e),
+    (SELECT json_group_array(json_object(
+        'id', c.id, 'node_id', c.node_id, 'label', c.label, 'text', c.text,
+        'is_chosen', c.is_chosen, 'chosen_at', c.chosen_at))
+     FROM (SELECT c.* FROM choices c
+           JOIN nodes n ON n.id = c.node_id
+           WHERE n.session_id = sessions.id
+           ORDER BY c.node_id, c.id) c)
+FROM sessions
+WHERE id = ?
+"""
+
+
 def _build_session_graph(
     session_id: int,
     status: NodeStatus | None = None,
     unchosen_only: bool = False,
 ) -> SessionGraphOut:
-    with get_conn() as conn:
-        session_row = conn.execute(
-            """
-            SELECT id, external_id, name, started_at, ended_at, created_at
-            FROM sessions
-            WHERE id = ?
-            """,
-            (session_id,),
-        ).fetchone()
-        if session_row is None:
-            raise HTTPException(status_code=404, detail="Session not found")
+    with get_readonly_conn() as conn:
+        row = conn.execute(SQL_SESSION_GRAPH, (session_id,)).fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    session_row = row
 
-        node_rows = conn.execute(
-            """
-            SELECT
-                id, session_id, external_ref, type, title, status,
-                rationale, owner, priority, context_prompt,
-                created_at, updated_at
-            FROM nodes
-            WHERE session_id = ?
-            ORDER BY id ASC
-            """,
-            (session_id,),
-        ).fetchall()
-        edge_rows = conn.execute(
-            """
-            SELECT e.id, e.from_node_id, e.to_node_id, e.type, e.created_at
-            FROM edges e
-            JOIN nodes n ON n.id = e.from_node_id
-            WHERE n.session_id = ?
-            ORDER BY e.id ASC
-            """,
-            (session_id,),
-        ).fetchall()
-        choice_rows = conn.execute(
-            """
-            SELECT c.id, c.node_id, c.label, c.text, c.is_chosen, c.chosen_at
-            FROM choices c
-            JOIN nodes n ON n.id = c.node_id
-            WHERE n.session_id = ?
-            ORDER BY c.node_id, c.id
-            """,
-            (session_id,),
-        ).fetchall()
-
-    nodes = [_row_to_node(row) for row in node_rows]
-    edges = [
-        EdgeOut(
-            id=row["id"],
-            from_node_id=row["from_node_id"],
-            to_node_id=row["to_node_id"],
-            type=row["type"],
-            created_at=row["created_at"],
-        )
-        for row in edge_rows
-    ]
+    nodes = [NodeOut.model_construct(**obj) for obj in orjson.loads(row[6])]
+    edges = [EdgeOut.model_construct(**obj) for obj in orjson.loads(row[7])]
     choices = [
-        ChoiceOut(
-            id=row["id"],
-            node_id=row["node_id"],
-            label=row["label"],
-            text=row["text"],
-            is_chosen=bool(row["is_chosen"]),
-            chosen_at=row["chosen_at"],
-        )
-        for row in choice_rows
+        ChoiceOut.model_construct(**{**obj, "is_chosen": bool(obj["is_chosen"])})
+        for obj in orjson.loads(row[8])
     ]
 
     visible_node_ids = {node.id for node in nodes}
@@ -449,7 +576,7 @@ def _build_session_graph(
     filtered_choices = [choice for choice in choices if choice.node_id in visible_node_ids]
 
     return SessionGraphOut(
-        session=_rows_to_sessions([session_row])[0],
+        session=_row_to_session(session_row),
         nodes=filtered_nodes,
         edges=filtered_edges,
         choices=filtered_choices,
@@ -458,62 +585,70 @@ def _build_session_graph(
 
 @app.post("/api/nodes", response_model=NodeOut, status_code=201)
 def create_node(payload: NodeCreate) -> NodeOut:
-    with get_conn() as conn:
-        session_row = conn.execute(
-            "SELECT id FROM sessions WHERE id = ?",
-            (payload.session_id,),
-        ).fetchone()
-        if session_row is None:
-            raise HTTPException(status_code=404, detail="Session not found")
+    try:
+        with get_conn() as conn:
+            row = conn.execute(
+                SQL_INSERT_NODE,
+                (
+                    payload.session_id,
+                    payload.type,
+                    payload.title.strip(),
+                    payload.status,
+                    payload.rationale,
+                    payload.owner,
+                    payload.priority,
+                    payload.context_prompt,
+                    payload.external_ref,
+                ),
+            ).fetchone()
+    except sqlite3.IntegrityError as exc:
+        # foreign_keys=ON turns a dangling session_id into a constraint error.
+        raise HTTPException(status_code=404, detail="Session not found") from exc
+    return _row_to_node(row)
 
-        cursor = conn.execute(
-            """
-            INSERT INTO nodes (
-                session_id, type, title, status, rationale, owner, priority, context_prompt, external_ref
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                payload.session_id,
-                payload.type,
-                payload.title.strip(),
-                payload.status,
-                payload.rationale,
-                payload.owner,
-                payload.priority,
-                payload.context_prompt,
-                payload.external_ref,
-            ),
+
+@app.post("/api/nodes:bulk", response_model=list[NodeOut], status_code=201)
+def create_nodes_bulk(payload: list[NodeCreate]) -> list[NodeOut]:
+    if not payload:
+        return []
+
+    rows_to_insert = [
+        (
+            item.session_id,
+            item.type,
+            item.title.strip(),
+            item.status,
+            item.rationale,
+            item.owner,
+            item.priority,
+            item.context_prompt,
+            item.external_ref,
         )
-        node_id = cursor.lastrowid
-        row = conn.execute(
-            """
-            SELECT
-                id, session_id, external_ref, type, title, status,
-                rationale, owner, priority, context_prompt,
-                created_at, updated_at
-            FROM nodes
-            WHERE id = ?
-            """,
-            (node_id,),
-        ).fetchone()
-    return _row_to_node(row)
+        for item in payload
+    ]
+    try:
+        with get_conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(SQL_INSERT_NODE_BULK, rows_to_insert)
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            first_id = last_id - len(rows_to_insert) + 1
+            rows = conn.execute(
+                f"SELECT {_NODE_FIELDS} FROM nodes WHERE id >= ? ORDER BY id ASC",
+                (first_id,),
+            ).fetchall()
+    except sqlite3.IntegrityError as exc:
+        raise HTTPException(status_code=404, detail="Session not found") from exc
+    return [_row_to_node(row) for row in rows]
 
 
 @app.get("/api/nodes/{node_id}", response_model=NodeOut)
-def get_node(node_id: int) -> NodeOut:
-    with get_conn() as conn:
-        row = conn.execute(
-            """
-            SELECT
-                id, session_id, external_ref, type, title, status,
-                rationale, owner, priority, context_prompt,
-                created_at, updated_at
-            FROM nodes
-            WHERE id = ?
-            """,
-            (node_id,),
-        ).fetchone()
+async def get_node(node_id: int) -> NodeOut:
+    return await asyncio.to_thread(_get_node_sync, node_id)
+
+
+def _get_node_sync(node_id: int) -> NodeOut:
+    with get_readonly_conn() as conn:
+        row = conn.execute(SQL_GET_NODE, (node_id,)).fetchone()
     if row is None:
         raise HTTPException(status_code=404, detail="Node not found")
     return _row_to_node(row)
@@ -521,41 +656,23 @@ def get_node(node_id: int) -> NodeOut:
 
 @app.patch("/api/nodes/{node_id}", response_model=NodeOut)
 def update_node(node_id: int, payload: NodeUpdate) -> NodeOut:
-    updates: list[str] = []
-    values: list[object] = []
     body = payload.model_dump(exclude_unset=True)
-
-    for field in ("status", "rationale", "owner", "priority"):
-        if field in body:
-            updates.append(f"{field} = ?")
-            values.append(body[field])
-
-    if not updates:
+    if not any(field in body for field in ("status", "rationale", "owner", "priority")):
         raise HTTPException(status_code=400, detail="No updatable fields provided")
 
-    updates.append("updated_at = datetime('now')")
-    values.append(node_id)
-
     with get_conn() as conn:
-        current = conn.execute("SELECT id FROM nodes WHERE id = ?", (node_id,)).fetchone()
-        if current is None:
-            raise HTTPException(status_code=404, detail="Node not found")
-
-        conn.execute(
-            f"UPDATE nodes SET {', '.join(updates)} WHERE id = ?",
-            tuple(values),
-        )
         row = conn.execute(
-            """
-            SELECT
-                id, session_id, external_ref, type, title, status,
-                rationale, owner, priority, context_prompt,
-                created_at, updated_at
-            FROM nodes
-            WHERE id = ?
-            """,
-            (node_id,),
+            SQL_UPDATE_NODE,
+            (
+                body.get("status"),
+                body.get("rationale"),
+                body.get("owner"),
+                body.get("priority"),
+                node_id,
+            ),
         ).fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Node not found")
     return _row_to_node(row)
 
 
@@ -568,60 +685,106 @@ def get_replay_prompt(node_id: int, choice_label: str) -> ReplayPromptOut:
         return _build_replay_prompt(conn, node_id, choice_label)
 
 
-@app.post("/api/events", response_model=EventIngestOut, status_code=201)
-def ingest_event(payload: EventIn) -> EventIngestOut:
-    with get_conn() as conn:
-        session_id = _get_or_create_session_id(conn, payload.session_external_id)
-        affected_node_id = _apply_event(conn, session_id, payload)
+def _ingest_one(conn: sqlite3.Connection, payload: EventIn) -> EventIngestOut:
+    session_id = _get_or_create_session_id(conn, payload.session_external_id)
+    affected_node_id = _apply_event(conn, session_id, payload)
 
-        event_row = conn.execute(
-            """
-            INSERT INTO event_log (session_id, source, event_type, payload_json)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                session_id,
-                payload.source,
-                payload.event_type,
-                json.dumps(payload.model_dump(mode="json"), sort_keys=True),
-            ),
-        )
-    return EventIngestOut(
+    event_row = conn.execute(
+        """
+        INSERT INTO event_log (session_id, source, event_type, payload_json)
+        VALUES (?, ?, ?, ?)
+        """,
+        (
+            session_id,
+            payload.source,
+            payload.event_type,
+            # pydantic-core serializes straight to JSON; going through
+            # model_dump() first builds a throwaway dict per event.
+            payload.model_dump_json(),
+        ),
+    )
+    return EventIngestOut.model_construct(
         event_log_id=event_row.lastrowid,
         session_id=session_id,
         affected_node_id=affected_node_id,
     )
 
 
+# Validators built once at import: validate_json parses and validates the
+# raw body in one pydantic-core pass, skipping FastAPI's per-request body
+# plumbing (stdlib json.loads plus field-by-field dependency resolution).
+EVENT_ADAPTER: TypeAdapter[EventIn] = TypeAdapter(EventIn)
+EVENT_BATCH_ADAPTER: TypeAdapter[list[EventIn]] = TypeAdapter(list[EventIn])
+
+
+def _validate_body(adapter: TypeAdapter[Any], body: bytes) -> Any:
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as exc:
+        # Surface the same 422 shape FastAPI produces for model parameters.
+        raise RequestValidationError(exc.errors()) from exc
+
+
+def _ingest_event_sync(payload: EventIn) -> EventIngestOut:
+    with get_conn() as conn:
+        # Take the write lock up front: the handler issues several dependent
+        # statements and must commit (or roll back) as one unit.
+        conn.execute("BEGIN IMMEDIATE")
+        return _ingest_one(conn, payload)
+
+
+@app.post("/api/events", response_model=EventIngestOut, status_code=201)
+async def ingest_event(request: Request) -> EventIngestOut:
+    payload: EventIn = _validate_body(EVENT_ADAPTER, await request.body())
+    return await asyncio.to_thread(_ingest_event_sync, payload)
+
+
+def _ingest_events_batch_sync(payloads: list[EventIn]) -> list[EventIngestOut]:
+    with get_conn() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        return [_ingest_one(conn, payload) for payload in payloads]
+
+
+@app.post("/api/events:batch", response_model=list[EventIngestOut], status_code=201)
+async def ingest_events_batch(request: Request) -> list[EventIngestOut]:
+    """Apply a run of events in one transaction — one write lock, one fsync.
+
+    All-or-nothing: any failing event rolls the whole batch back, so a
+    caller can safely retry the full batch.
+    """
+    payloads: list[EventIn] = _validate_body(EVENT_BATCH_ADAPTER, await request.body())
+    return await asyncio.to_thread(_ingest_events_batch_sync, payloads)
+
+
+# One atomic upsert instead of SELECT-then-INSERT: the no-op DO UPDATE makes
+# RETURNING yield the existing row's id on conflict, and closes the race
+# between the probe and the insert. The conflict target carries the WHERE
+# clause of the partial unique index on external_id.
+SQL_UPSERT_SESSION = (
+    "INSERT INTO sessions (external_id, name, started_at)"
+    " VALUES (?, ?, datetime('now'))"
+    " ON CONFLICT(external_id) WHERE external_id IS NOT NULL"
+    " DO UPDATE SET external_id = external_id"
+    " RETURNING id"
+)
+
+
 def _get_or_create_session_id(conn: sqlite3.Connection, session_external_id: str) -> int:
     row = conn.execute(
-        "SELECT id FROM sessions WHERE external_id = ?",
-        (session_external_id,),
+        SQL_UPSERT_SESSION,
+        (session_external_id, f"Session {session_external_id}"),
     ).fetchone()
-    if row is not None:
-        return int(row["id"])
-
-    now = datetime.now(UTC).isoformat(timespec="seconds")
-    created = conn.execute(
-        """
-        INSERT INTO sessions (external_id, name, started_at)
-        VALUES (?, ?, ?)
-        """,
-        (session_external_id, f"Session {session_external_id}", now),
-    )
-    return int(created.lastrowid)
+    # Bump unconditionally: telling a fresh insert apart from a no-op upsert
+    # costs more than an occasional spurious cache refill.
+    _invalidate_sessions_cache()
+    return int(row[0])
 
 
 def _apply_event(conn: sqlite3.Connection, session_id: int, payload: EventIn) -> int | None:
-    if payload.event_type == "question_presented":
-        return _apply_question_presented(conn, session_id, payload)
-    if payload.event_type == "choice_selected":
-        return _apply_choice_selected(conn, session_id, payload)
-    if payload.event_type == "note_added":
-        return _apply_note_added(conn, session_id, payload)
-    if payload.event_type == "node_status_changed":
-        return _apply_node_status_changed(conn, session_id, payload)
-    raise HTTPException(status_code=400, detail="Unsupported event type")
+    handler = _EVENT_HANDLERS.get(payload.event_type)
+    if handler is None:
+        raise HTTPException(status_code=400, detail="Unsupported event type")
+    return handler(conn, session_id, payload)
 
 
 def _apply_question_presented(
@@ -637,31 +800,36 @@ def _apply_question_presented(
     rationale = _clean_ref(event_payload.get("rationale"))
     owner = f"agent:{event.agent_name}" if event.agent_name else None
 
-    cursor = conn.execute(
+    created = conn.execute(
         """
         INSERT INTO nodes (
             session_id, type, title, status, rationale, owner, context_prompt, external_ref
         )
         VALUES (?, 'question', ?, 'open', ?, ?, ?, ?)
+        RETURNING id
         """,
         (session_id, title, rationale, owner, context_prompt, node_ref),
-    )
-    node_id = int(cursor.lastrowid)
+    ).fetchone()
+    node_id = int(created[0])
 
     choices = event_payload.get("choices", [])
     if not isinstance(choices, list):
         raise HTTPException(status_code=400, detail="payload.choices must be a list")
 
-    for index, item in enumerate(choices):
-        label, text = _normalize_choice(item, index)
-        if text:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO choices (node_id, label, text)
-                VALUES (?, ?, ?)
-                """,
-                (node_id, label, text),
-            )
+    choice_rows = [
+        (node_id, label, text)
+        for index, item in enumerate(choices)
+        for label, text in (_normalize_choice(item, index),)
+        if text
+    ]
+    if choice_rows:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO choices (node_id, label, text)
+            VALUES (?, ?, ?)
+            """,
+            choice_rows,
+        )
 
     parent_ref = _clean_ref(event_payload.get("parent_node_ref") or event_payload.get("from_node_ref"))
     if parent_ref:
@@ -696,26 +864,29 @@ def _apply_choice_selected(conn: sqlite3.Connection, session_id: int, event: Eve
 
     choice_text = _clean_ref(event_payload.get("choice_text"))
 
+    # is_chosen = 1 in the predicate lets the clear touch only rows that
+    # actually need flipping (usually one) instead of the whole choice set.
     conn.execute(
-        "UPDATE choices SET is_chosen = 0, chosen_at = NULL WHERE node_id = ?",
+        """
+        UPDATE choices
+        SET is_chosen = 0, chosen_at = NULL
+        WHERE node_id = ? AND is_chosen = 1
+        """,
         (node_id,),
     )
-    updated = conn.execute(
+    # Upsert against idx_choices_node_label: marks an existing choice chosen
+    # or records a write-in, replacing the old update-then-fallback-insert.
+    conn.execute(
         """
-        UPDATE choices
-        SET is_chosen = 1, chosen_at = datetime('now')
-        WHERE node_id = ? AND label = ?
+        INSERT INTO choices (node_id, label, text, is_chosen, chosen_at)
+        VALUES (?, ?, COALESCE(?, ?), 1, datetime('now'))
+        ON CONFLICT(node_id, label) DO UPDATE
+        SET is_chosen = 1,
+            chosen_at = excluded.chosen_at,
+            text = COALESCE(?, text)
         """,
-        (node_id, choice_label),
+        (node_id, choice_label, choice_text, choice_label, choice_text),
     )
-    if updated.rowcount == 0:
-        conn.execute(
-            """
-            INSERT INTO choices (node_id, label, text, is_chosen, chosen_at)
-            VALUES (?, ?, ?, 1, datetime('now'))
-            """,
-            (node_id, choice_label, choice_text or choice_label),
-        )
 
     return node_id
 
@@ -770,6 +941,15 @@ def _apply_node_status_changed(
     return node_id
 
 
+# O(1) dispatch table for _apply_event, keyed by EventType literal.
+_EVENT_HANDLERS: dict[str, Callable[[sqlite3.Connection, int, EventIn], int | None]] = {
+    "question_presented": _apply_question_presented,
+    "choice_selected": _apply_choice_selected,
+    "note_added": _apply_note_added,
+    "node_status_changed": _apply_node_status_changed,
+}
+
+
 def _latest_question_node_id(conn: sqlite3.Connection, session_id: int) -> int | None:
     row = conn.execute(
         """
@@ -786,32 +966,44 @@ def _latest_question_node_id(conn: sqlite3.Connection, session_id: int) -> int |
     return int(row["id"])
 
 
+# All-digit refs address nodes by id, anything else by external_ref — the
+# same split the old Python isdigit() branch made, folded into one cached
+# statement ('*[^0-9]*' matches any string containing a non-digit).
+SQL_RESOLVE_NODE = (
+    "SELECT id FROM nodes"
+    " WHERE session_id = ?"
+    " AND ((? NOT GLOB '*[^0-9]*' AND id = CAST(? AS INTEGER))"
+    "      OR (? GLOB '*[^0-9]*' AND external_ref = ?))"
+    " LIMIT 1"
+)
+
+
 def _resolve_node_id(
     conn: sqlite3.Connection, session_id: int, node_ref: str | None
 ) -> int | None:
     if not node_ref:
         return None
-
-    if node_ref.isdigit():
-        row = conn.execute(
-            "SELECT id FROM nodes WHERE id = ? AND session_id = ?",
-            (int(node_ref), session_id),
-        ).fetchone()
-        return int(row["id"]) if row else None
-
     row = conn.execute(
-        "SELECT id FROM nodes WHERE external_ref = ? AND session_id = ?",
-        (node_ref, session_id),
+        SQL_RESOLVE_NODE,
+        (session_id, node_ref, node_ref, node_ref, node_ref),
     ).fetchone()
-    return int(row["id"]) if row else None
+    return int(row[0]) if row else None
+
+
+# Default labels A..Z, precomputed once for the event-ingest hot path.
+_CHOICE_LABELS = tuple(chr(65 + i) for i in range(26))
+
+
+def _default_choice_label(index: int) -> str:
+    return _CHOICE_LABELS[index] if index < 26 else chr(65 + index)
 
 
 def _normalize_choice(item: Any, index: int) -> tuple[str, str]:
     if isinstance(item, dict):
-        label = str(item.get("label") or chr(65 + index)).strip()
+        label = str(item.get("label") or _default_choice_label(index)).strip()
         text = str(item.get("text") or "").strip()
         return label, text
-    return chr(65 + index), str(item).strip()
+    return _default_choice_label(index), str(item).strip()
 
 
 def _clean_ref(value: Any) -> str | None:
@@ -870,7 +1062,7 @@ def _build_replay_prompt(
         "Generate an incremental implementation plan for this alternative, list risks, "
         "and describe how to apply it without discarding current progress."
     )
-    return ReplayPromptOut(
+    return ReplayPromptOut.model_construct(
         node_id=node_id,
         choice_label=choice["label"],
         prompt=prompt,
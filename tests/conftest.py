@@ -1,8 +1,114 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
+import httpx
+import pytest
+import pytest_asyncio
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from interfaces.http import main  # noqa: E402
+from interfaces.http.db import get_conn  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    """One app instance for the whole run.
+
+    Entering TestClient runs FastAPI startup (DB open, schema create); doing
+    that once instead of per test is the dominant saving in this suite. The
+    shared-cache in-memory URI keeps every connection on the same RAM
+    database, so tests never touch disk; db.init_db holds an anchor
+    connection so the database outlives individual requests.
+    """
+    # Under pytest-xdist each worker is its own process; naming the shared
+    # memory database after the worker keeps parallel runs from colliding.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    os.environ["ATRIUM_DB_PATH"] = f"file:atrium_{worker}?mode=memory&cache=shared"
+    os.environ["ATRIUM_TEST_MODE"] = "1"
+    with TestClient(main.app) as test_client:
+        # Startup kicks off schema creation in the background; one throwaway
+        # request waits on it so the cleanup fixture always sees the tables.
+        test_client.get("/api/sessions")
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(client: TestClient) -> httpx.AsyncClient:
+    """In-process async client for tests that overlap requests.
+
+    Talks straight to the ASGI app on the test's own event loop, skipping
+    TestClient's per-request thread hop. Depends on the sync client fixture
+    because that is what keeps the app's lifespan (and database) alive.
+    """
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture
+def session_id(client: TestClient) -> int:
+    """A bare session inserted straight through SQL.
+
+    For tests that only need an id as setup; session creation itself is
+    covered by the HTTP-level tests.
+    """
+    with get_conn() as conn:
+        row = conn.execute(
+            "INSERT INTO sessions (name) VALUES ('Fixture Session') RETURNING id"
+        ).fetchone()
+    main._invalidate_sessions_cache()
+    return int(row[0])
+
+
+@pytest.fixture
+def question_node(client: TestClient, session_id: int) -> dict:
+    """A question node with two choices (B chosen), inserted via SQL.
+
+    Mirrors the state the ingest pipeline produces for a presented question
+    plus a selection, without paying two HTTP round trips of setup.
+    """
+    with get_conn() as conn:
+        node_row = conn.execute(
+            """
+            INSERT INTO nodes (
+                session_id, type, title, status, owner, context_prompt, external_ref
+            )
+            VALUES (?, 'question', 'Pick rendering approach', 'open',
+                    'agent:codex', 'We need graph + panel.', 'q-workspace-1')
+            RETURNING id
+            """,
+            (session_id,),
+        ).fetchone()
+        node_id = int(node_row[0])
+        conn.execute(
+            "INSERT INTO choices (node_id, label, text, is_chosen)"
+            " VALUES (?, 'A', 'Table', 0)",
+            (node_id,),
+        )
+        conn.execute(
+            "INSERT INTO choices (node_id, label, text, is_chosen, chosen_at)"
+            " VALUES (?, 'B', 'Cytoscape', 1, datetime('now'))",
+            (node_id,),
+        )
+    return {"session_id": session_id, "node_id": node_id}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_database(client: TestClient) -> None:
+    # Truncate instead of re-creating the database file: tests stay isolated
+    # while the connection pool and page cache stay warm. Child tables first
+    # to keep foreign keys happy.
+    with get_conn() as conn:
+        for table in ("event_log", "edges", "choices", "nodes", "sessions"):
+            conn.execute(f"DELETE FROM {table}")
+    main._invalidate_sessions_cache()
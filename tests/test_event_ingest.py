@@ -1,16 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
-import os
+from collections import defaultdict
 from pathlib import Path
 
-from fastapi.testclient import TestClient
-
-from interfaces.http.main import app
-
-
-def _set_test_db(tmp_path: Path) -> None:
-    os.environ["ATRIUM_DB_PATH"] = str(tmp_path / "atrium_events_test.db")
+import httpx
+import orjson
+import pytest
 
 
 def _load_fixture(name: str) -> list[dict]:
@@ -18,13 +15,38 @@ def _load_fixture(name: str) -> list[dict]:
     return json.loads(fixture_path.read_text())
 
 
-def test_event_ingest_maps_to_graph_state(tmp_path: Path) -> None:
-    _set_test_db(tmp_path)
+def _index_graph(graph_json: dict) -> dict:
+    """Index a graph payload once so assertions use lookups, not scans."""
+    choices_by_node: dict[int, list[dict]] = defaultdict(list)
+    for choice in graph_json["choices"]:
+        choices_by_node[choice["node_id"]].append(choice)
+    return {
+        "nodes_by_ref": {node["external_ref"]: node for node in graph_json["nodes"]},
+        "choices_by_node": choices_by_node,
+        "edges": graph_json["edges"],
+    }
 
-    with TestClient(app) as client:
-        question_1 = client.post(
-            "/api/events",
-            json={
+
+def _post_json(client_: httpx.AsyncClient, url: str, json: dict | list):
+    # Pre-serialize with orjson instead of letting httpx run stdlib json
+    # over every nested payload; awaitable, so it composes with gather.
+    return client_.post(
+        url,
+        content=orjson.dumps(json),
+        headers={"content-type": "application/json"},
+    )
+
+
+def _json(response: httpx.Response) -> dict | list:
+    return orjson.loads(response.content)
+
+
+@pytest.mark.asyncio
+async def test_event_ingest_maps_to_graph_state(async_client: httpx.AsyncClient) -> None:
+    batch = await _post_json(async_client,
+        "/api/events:batch",
+        json=[
+            {
                 "source": "mcp",
                 "event_type": "question_presented",
                 "session_external_id": "session-001",
@@ -40,14 +62,7 @@ def test_event_ingest_maps_to_graph_state(tmp_path: Path) -> None:
                     ],
                 },
             },
-        )
-        assert question_1.status_code == 201
-        body_1 = question_1.json()
-        session_id = body_1["session_id"]
-
-        choose = client.post(
-            "/api/events",
-            json={
+            {
                 "source": "mcp",
                 "event_type": "choice_selected",
                 "session_external_id": "session-001",
@@ -56,12 +71,7 @@ def test_event_ingest_maps_to_graph_state(tmp_path: Path) -> None:
                     "choice_label": "B",
                 },
             },
-        )
-        assert choose.status_code == 201
-
-        note = client.post(
-            "/api/events",
-            json={
+            {
                 "source": "mcp",
                 "event_type": "note_added",
                 "session_external_id": "session-001",
@@ -70,12 +80,7 @@ def test_event_ingest_maps_to_graph_state(tmp_path: Path) -> None:
                     "note": "Selected MCP to reduce friction.",
                 },
             },
-        )
-        assert note.status_code == 201
-
-        question_2 = client.post(
-            "/api/events",
-            json={
+            {
                 "source": "mcp",
                 "event_type": "question_presented",
                 "session_external_id": "session-001",
@@ -89,12 +94,7 @@ def test_event_ingest_maps_to_graph_state(tmp_path: Path) -> None:
                     ],
                 },
             },
-        )
-        assert question_2.status_code == 201
-
-        status_change = client.post(
-            "/api/events",
-            json={
+            {
                 "source": "mcp",
                 "event_type": "node_status_changed",
                 "session_external_id": "session-001",
@@ -103,99 +103,106 @@ def test_event_ingest_maps_to_graph_state(tmp_path: Path) -> None:
                     "status": "blocked",
                 },
             },
-        )
-        assert status_change.status_code == 201
-
-        graph = client.get(f"/api/sessions/{session_id}/graph")
-        assert graph.status_code == 200
-        graph_json = graph.json()
-
-        assert graph_json["session"]["external_id"] == "session-001"
-        assert len(graph_json["nodes"]) == 2
-        assert len(graph_json["edges"]) == 1
-
-        nodes_by_ref = {node["external_ref"]: node for node in graph_json["nodes"]}
-        assert nodes_by_ref["q-1"]["owner"] == "agent:codex"
-        assert "Selected MCP" in nodes_by_ref["q-1"]["rationale"]
-        assert nodes_by_ref["q-2"]["status"] == "blocked"
-
-        q1_id = nodes_by_ref["q-1"]["id"]
-        q1_choices = [c for c in graph_json["choices"] if c["node_id"] == q1_id]
-        chosen = [c for c in q1_choices if c["is_chosen"]]
-        assert len(chosen) == 1
-        assert chosen[0]["label"] == "B"
-
-        edge = graph_json["edges"][0]
-        assert edge["from_node_id"] == nodes_by_ref["q-1"]["id"]
-        assert edge["to_node_id"] == nodes_by_ref["q-2"]["id"]
-
-
-def test_choice_selected_falls_back_to_latest_question(tmp_path: Path) -> None:
-    _set_test_db(tmp_path)
-
-    with TestClient(app) as client:
-        first = client.post(
-            "/api/events",
-            json={
-                "event_type": "question_presented",
-                "session_external_id": "session-002",
-                "payload": {
-                    "node_ref": "q-latest",
-                    "title": "Choose next step",
-                    "choices": ["Option A", "Option B"],
-                },
+        ],
+    )
+    assert batch.status_code == 201
+    results = _json(batch)
+    assert len(results) == 5
+    session_id = results[0]["session_id"]
+    assert all(result["session_id"] == session_id for result in results)
+
+    graph = await async_client.get(f"/api/sessions/{session_id}/graph")
+    assert graph.status_code == 200
+    graph_json = _json(graph)
+
+    assert graph_json["session"]["external_id"] == "session-001"
+    assert len(graph_json["nodes"]) == 2
+    assert len(graph_json["edges"]) == 1
+
+    indexed = _index_graph(graph_json)
+    nodes_by_ref = indexed["nodes_by_ref"]
+    assert nodes_by_ref["q-1"]["owner"] == "agent:codex"
+    assert "Selected MCP" in nodes_by_ref["q-1"]["rationale"]
+    assert nodes_by_ref["q-2"]["status"] == "blocked"
+
+    q1_choices = indexed["choices_by_node"][nodes_by_ref["q-1"]["id"]]
+    chosen = [c for c in q1_choices if c["is_chosen"]]
+    assert len(chosen) == 1
+    assert chosen[0]["label"] == "B"
+
+    edge = indexed["edges"][0]
+    assert edge["from_node_id"] == nodes_by_ref["q-1"]["id"]
+    assert edge["to_node_id"] == nodes_by_ref["q-2"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_choice_selected_falls_back_to_latest_question(
+    async_client: httpx.AsyncClient,
+) -> None:
+    first = await _post_json(async_client,
+        "/api/events",
+        json={
+            "event_type": "question_presented",
+            "session_external_id": "session-002",
+            "payload": {
+                "node_ref": "q-latest",
+                "title": "Choose next step",
+                "choices": ["Option A", "Option B"],
             },
-        )
-        assert first.status_code == 201
-        session_id = first.json()["session_id"]
-
-        choose = client.post(
-            "/api/events",
-            json={
-                "event_type": "choice_selected",
-                "session_external_id": "session-002",
-                "payload": {
-                    "choice_label": "A",
-                },
+        },
+    )
+    assert first.status_code == 201
+    session_id = _json(first)["session_id"]
+
+    choose = await _post_json(async_client,
+        "/api/events",
+        json={
+            "event_type": "choice_selected",
+            "session_external_id": "session-002",
+            "payload": {
+                "choice_label": "A",
             },
-        )
-        assert choose.status_code == 201
-
-        graph = client.get(f"/api/sessions/{session_id}/graph")
-        assert graph.status_code == 200
-        graph_json = graph.json()
-
-        node_id = graph_json["nodes"][0]["id"]
-        chosen = [c for c in graph_json["choices"] if c["node_id"] == node_id and c["is_chosen"]]
-        assert len(chosen) == 1
-        assert chosen[0]["label"] == "A"
-
-
-def test_graph_filters_and_replay_prompt(tmp_path: Path) -> None:
-    _set_test_db(tmp_path)
-
-    with TestClient(app) as client:
-        base = client.post(
-            "/api/events",
-            json={
-                "event_type": "question_presented",
-                "session_external_id": "session-003",
-                "payload": {
-                    "node_ref": "q-filter-1",
-                    "title": "Choose rollout path",
-                    "context_prompt": "Current path is conservative.",
-                    "choices": [
-                        {"label": "A", "text": "Conservative"},
-                        {"label": "B", "text": "Aggressive"},
-                    ],
-                },
+        },
+    )
+    assert choose.status_code == 201
+
+    graph = await async_client.get(f"/api/sessions/{session_id}/graph")
+    assert graph.status_code == 200
+    graph_json = _json(graph)
+
+    indexed = _index_graph(graph_json)
+    node_id = graph_json["nodes"][0]["id"]
+    chosen = [c for c in indexed["choices_by_node"][node_id] if c["is_chosen"]]
+    assert len(chosen) == 1
+    assert chosen[0]["label"] == "A"
+
+
+@pytest.mark.asyncio
+async def test_graph_filters_and_replay_prompt(async_client: httpx.AsyncClient) -> None:
+    base = await _post_json(async_client,
+        "/api/events",
+        json={
+            "event_type": "question_presented",
+            "session_external_id": "session-003",
+            "payload": {
+                "node_ref": "q-filter-1",
+                "title": "Choose rollout path",
+                "context_prompt": "Current path is conservative.",
+                "choices": [
+                    {"label": "A", "text": "Conservative"},
+                    {"label": "B", "text": "Aggressive"},
+                ],
             },
-        )
-        assert base.status_code == 201
-        session_id = base.json()["session_id"]
-        node_id = base.json()["affected_node_id"]
-
-        client.post(
+        },
+    )
+    assert base.status_code == 201
+    session_id = _json(base)["session_id"]
+    node_id = _json(base)["affected_node_id"]
+
+    # The choice targets q-filter-1 by ref and the second question doesn't
+    # depend on it, so the two posts can overlap.
+    await asyncio.gather(
+        _post_json(async_client,
             "/api/events",
             json={
                 "event_type": "choice_selected",
@@ -205,9 +212,8 @@ def test_graph_filters_and_replay_prompt(tmp_path: Path) -> None:
                     "choice_label": "A",
                 },
             },
-        )
-
-        client.post(
+        ),
+        _post_json(async_client,
             "/api/events",
             json={
                 "event_type": "question_presented",
@@ -218,68 +224,64 @@ def test_graph_filters_and_replay_prompt(tmp_path: Path) -> None:
                     "choices": ["One", "Two"],
                 },
             },
-        )
-        client.post(
-            "/api/events",
-            json={
-                "event_type": "node_status_changed",
-                "session_external_id": "session-003",
-                "payload": {
-                    "node_ref": "q-filter-2",
-                    "status": "done",
-                },
+        ),
+    )
+    await _post_json(async_client,
+        "/api/events",
+        json={
+            "event_type": "node_status_changed",
+            "session_external_id": "session-003",
+            "payload": {
+                "node_ref": "q-filter-2",
+                "status": "done",
             },
-        )
-
-        filtered_status = client.get(f"/api/sessions/{session_id}/graph?status=done")
-        assert filtered_status.status_code == 200
-        done_nodes = filtered_status.json()["nodes"]
-        assert len(done_nodes) == 1
-        assert done_nodes[0]["external_ref"] == "q-filter-2"
-
-        filtered_unchosen = client.get(f"/api/sessions/{session_id}/graph?unchosen_only=true")
-        assert filtered_unchosen.status_code == 200
-        unchosen_nodes = filtered_unchosen.json()["nodes"]
-        assert len(unchosen_nodes) == 2
-
-        replay = client.get(f"/api/nodes/{node_id}/replay-prompt?choice_label=B")
-        assert replay.status_code == 200
-        prompt = replay.json()["prompt"]
-        assert "Decision point: Choose rollout path" in prompt
-        assert "Previously chosen path: A: Conservative" in prompt
-        assert "Alternative to execute now: B: Aggressive" in prompt
-
-
-def test_ingest_from_sample_fixture_payloads(tmp_path: Path) -> None:
-    _set_test_db(tmp_path)
-
-    with TestClient(app) as client:
-        events = _load_fixture("session_happy_path.json")
-        session_id: int | None = None
-        for event in events:
-            response = client.post("/api/events", json=event)
-            assert response.status_code == 201
-            if session_id is None:
-                session_id = response.json()["session_id"]
-
-        assert session_id is not None
-
-        graph = client.get(f"/api/sessions/{session_id}/graph")
-        assert graph.status_code == 200
-        graph_json = graph.json()
-        assert graph_json["session"]["external_id"] == "fixture-session-001"
-        assert len(graph_json["nodes"]) == 2
-        assert len(graph_json["edges"]) == 1
-
-        first = next(
-            node for node in graph_json["nodes"] if node["external_ref"] == "q-fixture-1"
-        )
-        second = next(
-            node for node in graph_json["nodes"] if node["external_ref"] == "q-fixture-2"
-        )
-        assert first["owner"] == "agent:codex"
-        assert second["status"] == "in_progress"
-
-        replay = client.get(f"/api/nodes/{first['id']}/replay-prompt?choice_label=C")
-        assert replay.status_code == 200
-        assert "Alternative to execute now: C: Plugin first" in replay.json()["prompt"]
+        },
+    )
+
+    filtered_status = await async_client.get(f"/api/sessions/{session_id}/graph?status=done")
+    assert filtered_status.status_code == 200
+    done_nodes = _json(filtered_status)["nodes"]
+    assert len(done_nodes) == 1
+    assert done_nodes[0]["external_ref"] == "q-filter-2"
+
+    filtered_unchosen = await async_client.get(f"/api/sessions/{session_id}/graph?unchosen_only=true")
+    assert filtered_unchosen.status_code == 200
+    unchosen_nodes = _json(filtered_unchosen)["nodes"]
+    assert len(unchosen_nodes) == 2
+
+    replay = await async_client.get(f"/api/nodes/{node_id}/replay-prompt?choice_label=B")
+    assert replay.status_code == 200
+    prompt = _json(replay)["prompt"]
+    assert "Decision point: Choose rollout path" in prompt
+    assert "Previously chosen path: A: Conservative" in prompt
+    assert "Alternative to execute now: B: Aggressive" in prompt
+
+
+@pytest.mark.asyncio
+async def test_ingest_from_sample_fixture_payloads(async_client: httpx.AsyncClient) -> None:
+    events = _load_fixture("session_happy_path.json")
+    session_id: int | None = None
+    for event in events:
+        response = await _post_json(async_client, "/api/events", json=event)
+        assert response.status_code == 201
+        if session_id is None:
+            session_id = _json(response)["session_id"]
+
+    assert session_id is not None
+
+    graph = await async_client.get(f"/api/sessions/{session_id}/graph")
+    assert graph.status_code == 200
+    graph_json = _json(graph)
+    assert graph_json["session"]["external_id"] == "fixture-session-001"
+    assert len(graph_json["nodes"]) == 2
+    assert len(graph_json["edges"]) == 1
+
+    nodes_by_ref = _index_graph(graph_json)["nodes_by_ref"]
+    first = nodes_by_ref["q-fixture-1"]
+    second = nodes_by_ref["q-fixture-2"]
+    assert first["owner"] == "agent:codex"
+    assert second["status"] == "in_progress"
+
+    replay = await async_client.get(f"/api/nodes/{first['id']}/replay-prompt?choice_label=C")
+    assert replay.status_code == 200
+    assert "Alternative to execute now: C: Plugin first" in _json(replay)["prompt"]